@@ -338,6 +338,59 @@ def get_channel_data(processed_data: ProcessedData, row: int, col: int) -> Optio
     return processed_data.data[row - 1, col - 1]
 
 
+def downsample_minmax(time: np.ndarray, signal: np.ndarray,
+                      max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a signal to a min/max envelope for plotting.
+
+    The signal is split into max_points // 2 equal bins and the minimum and
+    maximum sample of each bin are kept (in their original order), so peaks
+    remain visible while far fewer points are drawn.
+
+    Args:
+        time: Time values for each sample
+        signal: Signal values
+        max_points: Maximum number of points to return
+
+    Returns:
+        Tuple of (time, signal) arrays with at most max_points + 1 points.
+        Inputs that are already small enough are returned unchanged.
+    """
+    time = np.asarray(time)
+    signal = np.asarray(signal)
+    n_samples = len(signal)
+    n_bins = max_points // 2
+
+    if n_samples <= max_points or n_bins < 1:
+        return time, signal
+
+    # Round the bin size up so every sample falls in a bin; the samples
+    # left over after the full bins form one final, shorter bin
+    bin_size = -(-n_samples // n_bins)
+    n_full_bins = n_samples // bin_size
+    full_length = n_full_bins * bin_size
+
+    blocks = signal[:full_length].reshape(n_full_bins, bin_size)
+    idx_min = blocks.argmin(axis=1)
+    idx_max = blocks.argmax(axis=1)
+    offsets = np.arange(n_full_bins) * bin_size
+
+    if full_length < n_samples:
+        tail = signal[full_length:]
+        idx_min = np.append(idx_min, tail.argmin())
+        idx_max = np.append(idx_max, tail.argmax())
+        offsets = np.append(offsets, full_length)
+
+    indices = np.stack([offsets + np.minimum(idx_min, idx_max),
+                        offsets + np.maximum(idx_min, idx_max)], axis=1).ravel()
+
+    # Keep the final sample so the plot still spans the whole recording
+    if indices[-1] != n_samples - 1:
+        indices = np.append(indices, n_samples - 1)
+
+    return time[indices], signal[indices]
+
+
 if __name__ == "__main__":
     # Simple test
     if cpp_available:
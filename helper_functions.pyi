@@ -107,3 +107,22 @@ def get_channel_data(
         Returns None if channel has no data
     """
     ...
+
+
+def downsample_minmax(
+    time: np.ndarray,
+    signal: np.ndarray,
+    max_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a signal to a min/max envelope for plotting.
+
+    Args:
+        time: Time values for each sample
+        signal: Signal values
+        max_points: Maximum number of points to return
+
+    Returns:
+        Tuple of (time, signal) arrays with at most max_points + 1 points
+    """
+    ...
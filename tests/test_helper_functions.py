@@ -20,6 +20,7 @@ from helper_functions import (
     save_processed_data,
     load_processed_data,
     get_channel_data,
+    downsample_minmax,
 )
 
 
@@ -354,5 +355,68 @@ class TestProcessedDataIntegrity(unittest.TestCase):
             self.assertEqual(len(channel_data['DischargeTimes']), 2)
 
 
+class TestDownsampleMinmax(unittest.TestCase):
+    """Test downsample_minmax function"""
+
+    def test_short_signal_unchanged(self):
+        """Test that signals under the limit are returned as-is"""
+        time = np.arange(100) / 1000.0
+        signal = np.random.randn(100).astype(np.float32)
+
+        out_time, out_signal = downsample_minmax(time, signal, 200)
+
+        np.testing.assert_array_equal(out_time, time)
+        np.testing.assert_array_equal(out_signal, signal)
+
+    def test_preserves_extremes(self):
+        """Test that each bin's min and max survive downsampling"""
+        time = np.arange(10000) / 1000.0
+        signal = np.random.randn(10000).astype(np.float32)
+        signal[1234] = 50.0
+        signal[8765] = -50.0
+
+        out_time, out_signal = downsample_minmax(time, signal, 200)
+
+        self.assertLessEqual(len(out_signal), 201)
+        self.assertEqual(out_signal.max(), 50.0)
+        self.assertEqual(out_signal.min(), -50.0)
+        self.assertIn(1.234, out_time)
+
+    def test_time_stays_sorted(self):
+        """Test that output points keep their original order"""
+        time = np.arange(10001) / 1000.0
+        signal = np.random.randn(10001)
+
+        out_time, _ = downsample_minmax(time, signal, 500)
+
+        self.assertTrue(np.all(np.diff(out_time) >= 0))
+        self.assertEqual(out_time[-1], time[-1])
+
+    def test_keeps_extremes_in_tail(self):
+        """Test that samples after the last full bin are still represented"""
+        n_samples = 11999
+        time = np.arange(n_samples) / 1000.0
+        signal = np.zeros(n_samples)
+        signal[10000] = 100.0
+        signal[11500] = -100.0
+
+        out_time, out_signal = downsample_minmax(time, signal, 8000)
+
+        self.assertLessEqual(len(out_signal), 8001)
+        self.assertEqual(out_signal.max(), 100.0)
+        self.assertEqual(out_signal.min(), -100.0)
+        self.assertEqual(out_time[-1], time[-1])
+
+    def test_accepts_lists(self):
+        """Test that list inputs (e.g. time_vector) are supported"""
+        time = [i / 1000.0 for i in range(1000)]
+        signal = list(range(1000))
+
+        out_time, out_signal = downsample_minmax(time, signal, 100)
+
+        self.assertIsInstance(out_time, np.ndarray)
+        self.assertLessEqual(len(out_signal), 101)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ysa_signal.py
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import shutil
+import subprocess
+import unittest
+import tempfile
+import threading
+from unittest.mock import patch, MagicMock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ysa_signal
+
+
+def _mock_pypi_response(version, compress=False):
+    """Build a urlopen() context manager returning the given version"""
+    body = json.dumps({'versions': ['0.0.1', version]}).encode()
+    response = MagicMock()
+    response.headers = {'Content-Encoding': 'gzip'} if compress else {}
+    response.read.return_value = gzip.compress(body) if compress else body
+    response.__enter__.return_value = response
+    return response
+
+
+class TestCheckForUpdates(unittest.TestCase):
+    """Test _check_for_updates function"""
+
+    def setUp(self):
+        """Point the cache at a temporary directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        env_patcher = patch.dict(os.environ, {'XDG_CACHE_HOME': self.temp_dir})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        ysa_signal._update_check_done = False
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_cache(self, latest, age=0):
+        cache_file = ysa_signal._cache_path()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({'ts': time.time() - age, 'latest': latest}, f)
+
+    def test_cache_path_honors_xdg_cache_home(self):
+        """Test that the cache lives under XDG_CACHE_HOME"""
+        self.assertEqual(
+            str(ysa_signal._cache_path()),
+            os.path.join(self.temp_dir, 'ysa-signal', 'version_check.json'))
+
+    @patch('urllib.request.urlopen')
+    def test_fresh_cache_skips_network(self, mock_urlopen):
+        """Test that a fresh cache entry avoids the PyPI request"""
+        self.write_cache(ysa_signal.__version__)
+
+        ysa_signal._check_for_updates()
+
+        mock_urlopen.assert_not_called()
+
+    @patch('urllib.request.urlopen')
+    def test_stale_cache_refetches(self, mock_urlopen):
+        """Test that an expired cache entry is refreshed from PyPI"""
+        self.write_cache('0.0.1', age=ysa_signal._UPDATE_CHECK_TTL + 1)
+        mock_urlopen.return_value = _mock_pypi_response(
+            ysa_signal.__version__)
+
+        ysa_signal._check_for_updates()
+
+        mock_urlopen.assert_called_once()
+        with open(ysa_signal._cache_path()) as f:
+            self.assertEqual(json.load(f)['latest'], ysa_signal.__version__)
+
+    @patch('urllib.request.urlopen')
+    def test_missing_cache_is_created(self, mock_urlopen):
+        """Test that a successful lookup writes the cache file"""
+        mock_urlopen.return_value = _mock_pypi_response(
+            ysa_signal.__version__)
+
+        ysa_signal._check_for_updates()
+
+        self.assertTrue(ysa_signal._cache_path().exists())
+        self.assertEqual(os.listdir(ysa_signal._cache_path().parent),
+                         ['version_check.json'])
+
+    @patch('urllib.request.urlopen')
+    def test_requests_simple_json_index(self, mock_urlopen):
+        """Test that the lightweight simple index is queried as JSON"""
+        mock_urlopen.return_value = _mock_pypi_response(
+            ysa_signal.__version__)
+
+        ysa_signal._check_for_updates()
+
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual(request.full_url, "https://pypi.org/simple/ysa-signal/")
+        self.assertEqual(request.get_header('Accept'),
+                         "application/vnd.pypi.simple.v1+json")
+        self.assertEqual(request.get_header('Connection'), "close")
+
+    @patch('urllib.request.urlopen')
+    def test_gzip_response(self, mock_urlopen):
+        """Test that gzip-encoded responses are decompressed"""
+        mock_urlopen.return_value = _mock_pypi_response('9.9.9', compress=True)
+
+        ysa_signal._check_for_updates()
+
+        with open(ysa_signal._cache_path()) as f:
+            self.assertEqual(json.load(f)['latest'], '9.9.9')
+
+
+class TestLatestRelease(unittest.TestCase):
+    """Test _latest_release function"""
+
+    def test_unordered_versions(self):
+        """Test that the highest version wins regardless of list order"""
+        index = {'versions': ['1.0.10', '1.2.0', '1.0.9']}
+        self.assertEqual(ysa_signal._latest_release(index), '1.2.0')
+
+    def test_skips_prereleases(self):
+        """Test that pre-release versions are ignored"""
+        index = {'versions': ['1.2.15', '1.3.0rc1', '1.3.0.dev2']}
+        self.assertEqual(ysa_signal._latest_release(index), '1.2.15')
+
+    def test_skips_yanked_versions(self):
+        """Test that versions whose files are all yanked are ignored"""
+        index = {
+            'versions': ['1.2.15', '1.2.16'],
+            'files': [
+                {'filename': 'ysa_signal-1.2.15.tar.gz', 'yanked': False},
+                {'filename': 'ysa_signal-1.2.16-cp311-cp311-win_amd64.whl',
+                 'yanked': 'broken build'},
+                {'filename': 'ysa_signal-1.2.16.tar.gz', 'yanked': True},
+            ],
+        }
+        self.assertEqual(ysa_signal._latest_release(index), '1.2.15')
+
+    def test_partially_yanked_version_kept(self):
+        """Test that a version with any non-yanked file is still offered"""
+        index = {
+            'versions': ['1.2.15', '1.2.16'],
+            'files': [
+                {'filename': 'ysa_signal-1.2.16-cp311-cp311-win_amd64.whl',
+                 'yanked': True},
+                {'filename': 'ysa_signal-1.2.16.tar.gz', 'yanked': False},
+            ],
+        }
+        self.assertEqual(ysa_signal._latest_release(index), '1.2.16')
+
+    @patch.dict(sys.modules, {'packaging': None, 'packaging.version': None})
+    def test_fallback_without_packaging(self):
+        """Test release selection when packaging is not installed"""
+        index = {'versions': ['1.0.10', '1.1.0rc1', '1.0.9']}
+        self.assertEqual(ysa_signal._latest_release(index), '1.0.10')
+
+
+class TestIsNewerVersion(unittest.TestCase):
+    """Test _is_newer_version function"""
+
+    def test_equal_versions(self):
+        """Test that identical versions are not newer"""
+        self.assertFalse(ysa_signal._is_newer_version('1.2.15', '1.2.15'))
+
+    def test_numeric_ordering(self):
+        """Test that components compare numerically, not as strings"""
+        self.assertTrue(ysa_signal._is_newer_version('1.0.10', '1.0.9'))
+        self.assertFalse(ysa_signal._is_newer_version('1.0.9', '1.0.10'))
+
+    def test_older_release_than_dev_build(self):
+        """Test that a dev build ahead of PyPI does not trigger a notice"""
+        self.assertFalse(ysa_signal._is_newer_version('1.2.15', '1.3.0'))
+
+    @patch.dict(sys.modules, {'packaging': None, 'packaging.version': None})
+    def test_fallback_without_packaging(self):
+        """Test numeric comparison when packaging is not installed"""
+        self.assertTrue(ysa_signal._is_newer_version('1.0.10', '1.0.9'))
+        self.assertFalse(ysa_signal._is_newer_version('1.0.9', '1.0.10'))
+
+
+class TestShouldCheckForUpdates(unittest.TestCase):
+    """Test _should_check_for_updates function"""
+
+    def setUp(self):
+        env_patcher = patch.dict(os.environ)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        os.environ.pop('YSA_NO_UPDATE_CHECK', None)
+        self.mock_stderr = MagicMock()
+        self.mock_stderr.isatty.return_value = True
+
+    def test_interactive_session(self):
+        """Test that interactive runs perform the check"""
+        with patch('sys.stderr', self.mock_stderr), \
+                patch('sys.argv', ['ysa-signal']):
+            self.assertTrue(ysa_signal._should_check_for_updates())
+
+    def test_non_tty_session(self):
+        """Test that scripted runs without a terminal skip the check"""
+        self.mock_stderr.isatty.return_value = False
+        with patch('sys.stderr', self.mock_stderr), \
+                patch('sys.argv', ['ysa-signal']):
+            self.assertFalse(ysa_signal._should_check_for_updates())
+
+    def test_help_flags(self):
+        """Test that --help/--version runs skip the check"""
+        for flag in ('-h', '--help', '--version'):
+            with patch('sys.stderr', self.mock_stderr), \
+                    patch('sys.argv', ['ysa-signal', flag]):
+                self.assertFalse(ysa_signal._should_check_for_updates())
+
+    def test_env_var_opt_out(self):
+        """Test that YSA_NO_UPDATE_CHECK=1 disables the check"""
+        os.environ['YSA_NO_UPDATE_CHECK'] = '1'
+        with patch('sys.stderr', self.mock_stderr), \
+                patch('sys.argv', ['ysa-signal']):
+            self.assertFalse(ysa_signal._should_check_for_updates())
+
+
+class TestSuppressOutput(unittest.TestCase):
+    """Test _suppress_output context manager"""
+
+    def test_discards_python_output(self):
+        """Test that prints inside the block are dropped and streams restored"""
+        old_stdout = sys.stdout
+        with ysa_signal._suppress_output():
+            self.assertIs(sys.stdout, ysa_signal._NULL_WRITER)
+            self.assertEqual(sys.stdout.write("discarded"), 9)
+            print("discarded")
+        self.assertIs(sys.stdout, old_stdout)
+
+    def test_discards_fd_output(self):
+        """Test that writes to the C-level stdout descriptor are dropped"""
+        with tempfile.TemporaryFile() as capture:
+            saved_fd = os.dup(1)
+            os.dup2(capture.fileno(), 1)
+            try:
+                with ysa_signal._suppress_output():
+                    os.write(1, b"discarded")
+                os.write(1, b"kept")
+            finally:
+                os.dup2(saved_fd, 1)
+                os.close(saved_fd)
+            capture.seek(0)
+            self.assertEqual(capture.read(), b"kept")
+
+    def test_overlapping_threads(self):
+        """Test that out-of-order exits from two threads restore the streams"""
+        first_entered = threading.Event()
+        second_entered = threading.Event()
+        first_exited = threading.Event()
+        stdout_after_first_exit = []
+        old_stdout = sys.stdout
+
+        def first():
+            with ysa_signal._suppress_output():
+                first_entered.set()
+                second_entered.wait(5)
+            first_exited.set()
+
+        def second():
+            first_entered.wait(5)
+            with ysa_signal._suppress_output():
+                second_entered.set()
+                first_exited.wait(5)
+                stdout_after_first_exit.append(sys.stdout)
+
+        with tempfile.TemporaryFile() as capture:
+            saved_fd = os.dup(1)
+            os.dup2(capture.fileno(), 1)
+            try:
+                threads = [threading.Thread(target=first),
+                           threading.Thread(target=second)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join(10)
+                os.write(1, b"kept")
+            finally:
+                os.dup2(saved_fd, 1)
+                os.close(saved_fd)
+            capture.seek(0)
+            self.assertEqual(capture.read(), b"kept")
+
+        # Still suppressed after the other thread left its block
+        self.assertEqual(stdout_after_first_exit, [ysa_signal._NULL_WRITER])
+        self.assertIs(sys.stdout, old_stdout)
+        self.assertEqual(ysa_signal._suppress_depth, 0)
+
+
+class TestMain(unittest.TestCase):
+    """Test main entry point dispatch"""
+
+    @patch('ysa_signal.gui_mode', return_value=0)
+    def test_no_arguments_launches_gui(self, mock_gui_mode):
+        """Test that running without arguments goes straight to the GUI"""
+        with patch('sys.argv', ['ysa-signal']):
+            self.assertEqual(ysa_signal.main(), 0)
+        mock_gui_mode.assert_called_once_with()
+
+    @patch('ysa_signal.cli_mode', return_value=0)
+    def test_input_and_output_runs_cli(self, mock_cli_mode):
+        """Test that input and output paths select CLI mode"""
+        with patch('sys.argv', ['ysa-signal', 'in.brw', 'out.h5', '--do-analysis']):
+            self.assertEqual(ysa_signal.main(), 0)
+        mock_cli_mode.assert_called_once_with(
+            'in.brw', 'out.h5', do_analysis=True)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that importing ysa_signal stays lightweight"""
+
+    def test_import_does_not_load_helper_functions(self):
+        """Test that helper_functions is only imported when needed"""
+        repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, '-c',
+             "import sys, ysa_signal; print('helper_functions' in sys.modules)"],
+            cwd=repo_dir, stdout=subprocess.PIPE, universal_newlines=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_helpers_available_on_attribute_access(self):
+        """Test that helper functions are still importable from ysa_signal"""
+        from ysa_signal import load_processed_data, get_channel_data
+        import helper_functions
+        self.assertIs(load_processed_data, helper_functions.load_processed_data)
+        self.assertIs(get_channel_data, helper_functions.get_channel_data)
+
+    @patch.dict(sys.modules, {'helper_functions': None})
+    def test_missing_helpers_follow_attribute_protocol(self):
+        """Test that a failed helper import behaves like a missing attribute"""
+        # Drop helpers cached in the module by earlier attribute access
+        module_patcher = patch.dict(ysa_signal.__dict__)
+        module_patcher.start()
+        self.addCleanup(module_patcher.stop)
+        for name in ysa_signal._HELPER_NAMES:
+            ysa_signal.__dict__.pop(name, None)
+
+        self.assertFalse(ysa_signal.cpp_available)
+        self.assertFalse(hasattr(ysa_signal, 'process_and_store'))
+        self.assertIsNone(getattr(ysa_signal, 'load_processed_data', None))
+
+
+class TestPackageInit(unittest.TestCase):
+    """Test the package __init__ that wraps ysa_signal"""
+
+    def test_single_update_check_thread(self):
+        """Test that importing the package starts only one update check"""
+        repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = """
+import importlib.util, os, sys, threading
+os.environ.pop('YSA_NO_UPDATE_CHECK', None)
+sys.stderr.isatty = lambda: True
+started = []
+threading.Thread.start = lambda self: started.append(self)
+spec = importlib.util.spec_from_file_location(
+    'ysa_pkg', os.path.join(sys.argv[1], '__init__.py'),
+    submodule_search_locations=[sys.argv[1]])
+pkg = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(pkg)
+import ysa_signal
+print(len(started), pkg.main is ysa_signal.main, isinstance(pkg.cpp_available, bool))
+"""
+        result = subprocess.run(
+            [sys.executable, '-c', script, repo_dir],
+            cwd=repo_dir, stdout=subprocess.PIPE, universal_newlines=True)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], '1 True True')
+
+
+if __name__ == '__main__':
+    unittest.main()
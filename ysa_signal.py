@@ -10,13 +10,118 @@ Developer: Jake Cahoon
 
 import os
 import sys
-import argparse
+import contextlib
+import threading
 
 from _version import __version__
 
 # Check for updates
 _update_check_done = False
 
+# Seconds a cached PyPI lookup stays valid before hitting the network again
+_UPDATE_CHECK_TTL = 24 * 60 * 60
+
+
+def _cache_path():
+    """Return the path of the on-disk update check cache"""
+    from pathlib import Path
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ysa-signal" / "version_check.json"
+
+
+def _write_update_cache(latest_version):
+    """Atomically store the latest PyPI version and lookup time on disk"""
+    import json
+    import tempfile
+    import time
+
+    cache_file = _cache_path()
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(cache_file.parent), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'ts': time.time(), 'latest': latest_version}, f)
+        os.replace(tmp_path, str(cache_file))
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+
+def _parse_version(version):
+    """Parse a version string for ordering comparisons"""
+    try:
+        from packaging.version import parse
+    except ImportError:
+        # packaging is not a hard dependency; compare numeric components
+        return tuple(int(part) for part in version.split('.') if part.isdigit())
+    return parse(version)
+
+
+def _is_prerelease(version):
+    """Return True for pre-release and development versions"""
+    try:
+        from packaging.version import parse
+    except ImportError:
+        return not all(part.isdigit() for part in version.split('.'))
+    return parse(version).is_prerelease
+
+
+def _filename_version(filename):
+    """Extract the version from a wheel or sdist filename"""
+    if filename.endswith('.whl'):
+        return filename.split('-')[1]
+    for ext in ('.tar.gz', '.zip'):
+        if filename.endswith(ext):
+            return filename[:-len(ext)].rsplit('-', 1)[-1]
+    return None
+
+
+def _latest_release(index):
+    """
+    Return the newest installable release from a PEP 691 simple index.
+
+    PEP 700 does not guarantee the order of 'versions', so the maximum is
+    taken explicitly. Pre-releases and versions whose files are all yanked
+    are skipped, since pip would not install them by default.
+    """
+    yanked = {}
+    for file in index.get('files', []):
+        version = _filename_version(file.get('filename', ''))
+        if version is not None:
+            yanked[version] = yanked.get(version, True) and bool(file.get('yanked'))
+
+    releases = []
+    for version in index['versions']:
+        if yanked.get(version, False):
+            continue
+        try:
+            if not _is_prerelease(version):
+                releases.append((_parse_version(version), version))
+        except ValueError:
+            continue  # Not a valid version string
+
+    return max(releases)[1] if releases else None
+
+
+def _is_newer_version(latest_version, current_version):
+    """Return True if latest_version is a later release than current_version"""
+    # Fast path: avoids importing packaging when already up to date
+    if latest_version == current_version:
+        return False
+
+    return _parse_version(latest_version) > _parse_version(current_version)
+
+
+def _notify_if_outdated(latest_version):
+    """Print an update notice if latest_version is newer than __version__"""
+    if _is_newer_version(latest_version, __version__):
+        print(f"\n\033[93m┌{'─' * 50}┐", file=sys.stderr)
+        print(f"│ Update available: {__version__} → {latest_version}".ljust(
+            51) + "│", file=sys.stderr)
+        print(
+            "│ Run: pip install -U --force-reinstall ysa-signal".ljust(51) + "│", file=sys.stderr)
+        print(f"└{'─' * 50}┘\033[0m\n", file=sys.stderr)
+
 
 def _check_for_updates():
     """Check if a newer version is available on PyPI"""
@@ -26,49 +131,177 @@ def _check_for_updates():
     _update_check_done = True
 
     try:
-        import urllib.request
+        import gzip
         import json
+        import time
+        import urllib.request
 
-        # Fetch latest version from PyPI
-        url = "https://pypi.org/pypi/ysa-signal/json"
-        with urllib.request.urlopen(url, timeout=1) as response:
-            data = json.loads(response.read().decode())
-            latest_version = data['info']['version']
-
-            # Compare versions
-            if latest_version != __version__:
-                print(f"\n\033[93m┌{'─' * 50}┐", file=sys.stderr)
-                print(f"│ Update available: {__version__} → {latest_version}".ljust(
-                    51) + "│", file=sys.stderr)
-                print(
-                    "│ Run: pip install -U --force-reinstall ysa-signal".ljust(51) + "│", file=sys.stderr)
-                print(f"└{'─' * 50}┘\033[0m\n", file=sys.stderr)
+        # Use the cached lookup if it is still fresh
+        try:
+            with open(_cache_path()) as f:
+                cached = json.load(f)
+            if time.time() - cached['ts'] < _UPDATE_CHECK_TTL:
+                _notify_if_outdated(cached['latest'])
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # Fetch the release list from PyPI's simple index (PEP 691 JSON),
+        # which is a fraction of the size of the full project JSON
+        url = "https://pypi.org/simple/ysa-signal/"
+        request = urllib.request.Request(url, headers={
+            "Accept": "application/vnd.pypi.simple.v1+json",
+            "Accept-Encoding": "gzip",
+            # Don't leave a keep-alive socket open past interpreter shutdown
+            "Connection": "close",
+        })
+        with urllib.request.urlopen(request, timeout=1) as response:
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+        latest_version = _latest_release(json.loads(body.decode()))
+        if latest_version is None:
+            return
+
+        try:
+            _write_update_cache(latest_version)
+        except OSError:
+            pass
+
+        _notify_if_outdated(latest_version)
     except Exception:
         # Silently fail if check fails (offline, timeout, etc.)
         pass
 
 
+def _should_check_for_updates():
+    """Only check for updates in interactive sessions that will show the notice"""
+    if os.environ.get("YSA_NO_UPDATE_CHECK") == "1":
+        return False
+    if any(arg in ("-h", "--help", "--version") for arg in sys.argv[1:]):
+        return False
+    try:
+        return sys.stderr.isatty()
+    except Exception:
+        return False
+
+
 # Run update check in background (non-blocking)
-try:
-    import threading
-    threading.Thread(target=_check_for_updates, daemon=True).start()
-except Exception:
-    pass
-
-# Check if C++ extensions are available
-try:
-    from helper_functions import (
-        process_and_store,
-        save_processed_data,
-        load_processed_data,
-        get_channel_data,
-        cpp_available,
-    )
-except ImportError:
-    cpp_available = False
-    print("Error: Could not import helper_functions.")
-    print("Please run the setup wizard first: python setup_wizard.py")
-    sys.exit(1)
+if _should_check_for_updates():
+    try:
+        threading.Thread(target=_check_for_updates, daemon=True).start()
+    except Exception:
+        pass
+
+
+# Helper functions re-exported for programmatic use, imported on first
+# attribute access so that --help does not load NumPy/h5py/C++ extensions
+_HELPER_NAMES = {
+    'process_and_store',
+    'save_processed_data',
+    'load_processed_data',
+    'get_channel_data',
+    'cpp_available',
+}
+
+
+def __getattr__(name):
+    """Lazily import helper functions (PEP 562)"""
+    if name in _HELPER_NAMES:
+        try:
+            import helper_functions
+        except ImportError as exc:
+            # C++ extensions not yet built
+            if name == 'cpp_available':
+                return False
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}") from exc
+        for helper_name in _HELPER_NAMES:
+            globals()[helper_name] = getattr(helper_functions, helper_name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _NullWriter:
+    """File-like sink that discards writes without buffering them"""
+
+    def write(self, s):
+        return len(s)
+
+    def flush(self):
+        pass
+
+
+_NULL_WRITER = _NullWriter()
+
+
+# _suppress_output changes process-wide state; overlapping uses from the
+# processing worker and the Tk thread share a single redirection
+_suppress_lock = threading.Lock()
+_suppress_depth = 0
+_suppress_state = None
+
+
+def _redirect_output():
+    """Send stdout/stderr and file descriptors 1/2 to the null sinks"""
+    old_stdout = sys.stdout
+    old_stderr = sys.stderr
+    saved_fds = []
+
+    for stream in (old_stdout, old_stderr):
+        if stream is not None:
+            stream.flush()
+
+    # The extension writes to the C-level file descriptors, which a
+    # sys.stdout swap alone does not catch
+    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        for fd in (1, 2):
+            try:
+                saved_fds.append((fd, os.dup(fd)))
+                os.dup2(devnull_fd, fd)
+            except OSError:
+                pass  # No console attached (e.g. pythonw)
+    finally:
+        os.close(devnull_fd)
+
+    sys.stdout = _NULL_WRITER
+    sys.stderr = _NULL_WRITER
+    return old_stdout, old_stderr, saved_fds
+
+
+def _restore_output(state):
+    """Undo _redirect_output"""
+    old_stdout, old_stderr, saved_fds = state
+    sys.stdout = old_stdout
+    sys.stderr = old_stderr
+    for fd, saved_fd in saved_fds:
+        os.dup2(saved_fd, fd)
+        os.close(saved_fd)
+
+
+@contextlib.contextmanager
+def _suppress_output():
+    """
+    Silence stdout/stderr, including output written by the C++ extension.
+
+    Safe to nest and to overlap across threads: only the outermost enter
+    redirects the streams and only the last exit restores them.
+    """
+    global _suppress_depth, _suppress_state
+    with _suppress_lock:
+        if _suppress_depth == 0:
+            _suppress_state = _redirect_output()
+        _suppress_depth += 1
+
+    try:
+        yield
+    finally:
+        with _suppress_lock:
+            _suppress_depth -= 1
+            if _suppress_depth == 0:
+                state, _suppress_state = _suppress_state, None
+                _restore_output(state)
 
 
 def cli_mode(input_file: str, output_file: str, do_analysis: bool = False):
@@ -80,6 +313,18 @@ def cli_mode(input_file: str, output_file: str, do_analysis: bool = False):
         output_file: Output file path (.h5)
         do_analysis: Whether to perform seizure/SE analysis
     """
+    # Imported here so --help never pays for NumPy/h5py/C++ extension loading
+    try:
+        from helper_functions import (
+            process_and_store,
+            save_processed_data,
+            cpp_available,
+        )
+    except ImportError:
+        print("Error: Could not import helper_functions.")
+        print("Please run the setup wizard first: python setup_wizard.py")
+        return 1
+
     print("=" * 70)
     print("YSA Signal - CLI Mode")
     print("=" * 70)
@@ -121,6 +366,20 @@ def cli_mode(input_file: str, output_file: str, do_analysis: bool = False):
 
 def gui_mode():
     """Run in GUI mode with tkinter"""
+    try:
+        from helper_functions import (
+            process_and_store,
+            save_processed_data,
+            load_processed_data,
+            get_channel_data,
+            downsample_minmax,
+            cpp_available,
+        )
+    except ImportError:
+        print("Error: Could not import helper_functions.")
+        print("Please run the setup wizard first: python setup_wizard.py")
+        return 1
+
     try:
         import tkinter as tk
         from tkinter import filedialog, messagebox, ttk
@@ -128,6 +387,9 @@ def gui_mode():
         print("Error: tkinter not available. Please install tkinter!")
         return 1
 
+    import queue
+    import numpy as np
+
     if not cpp_available:
         root = tk.Tk()
         root.withdraw()
@@ -166,9 +428,43 @@ def gui_mode():
             self.notebook.add(self.process_tab, text="Process Files")
             self.notebook.add(self.viewer_tab, text="View Signals")
 
-            # Initialize tabs
+            # Background processing: a daemon worker thread, with log
+            # messages handed back to the Tk thread through a queue
+            self._log_queue = queue.Queue()
+            self._process_thread = None
+            self._process_error = None
+            master.protocol("WM_DELETE_WINDOW", self.on_close)
+
+            # Status messages waiting to be written by _flush_log
+            self._log_buf = []
+            self._log_flush_id = None
+
+            # Initialize tabs; the viewer tab (and its matplotlib import)
+            # is built the first time it is selected
+            self.viewer_initialized = False
             self.init_process_tab()
-            self.init_viewer_tab()
+            self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+            self.master.after(50, self._drain_log)
+
+        def on_close(self):
+            """Confirm before closing while a file is still being processed"""
+            if self._process_thread is not None and self._process_thread.is_alive():
+                if not messagebox.askokcancel(
+                        "Processing in Progress",
+                        "A file is still being processed. Closing now will stop "
+                        "processing and the output file may be incomplete.\n\n"
+                        "Close anyway?"):
+                    return
+            self.master.destroy()
+
+        def on_tab_changed(self, event=None):
+            """Build the viewer tab on first visit"""
+            if self.viewer_initialized:
+                return
+            if self.notebook.index("current") == self.notebook.index(self.viewer_tab):
+                self.viewer_initialized = True
+                self.init_viewer_tab()
 
         def init_process_tab(self):
             """Initialize the process files tab"""
@@ -315,16 +611,24 @@ def gui_mode():
 
             # Store grid data
             self.grid_cells = {}  # (row, col) -> cell_id
+            self.cell_channels = {}  # cell_id -> (row, col)
+            self.grid_geometry = None  # (x_offset, y_offset, cell_size)
             self.selected_channel = None
             self.selected_cell_id = None
             self.hovered_cell_id = None
             self.hovered_channel = None
             self.all_channels = []
+            # Set view of all_channels for O(1) membership checks in
+            # the per-event hover/click handlers
+            self.active_channel_set = frozenset()
 
             # Tooltip label
             self.tooltip_label = ttk.Label(
                 channel_frame, text="", relief="solid", borderwidth=1, background="lightyellow")
 
+            # Pending after() id for a debounced grid redraw
+            self._grid_redraw_id = None
+
             # Create initial empty grid
             self.create_grid()
 
@@ -344,12 +648,17 @@ def gui_mode():
             self.ax.set_title('Select a file and channel to view')
             self.ax.grid(True, alpha=0.3)
 
+            # Artists reused across plot_signal calls
+            self.signal_line = None
+            self.event_spans = []
+
             self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
             self.canvas.draw()
             self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
             # Store loaded data
             self.viewer_data = None
+            self.time_axis = None  # Shared time values for all channels
 
         def browse_input(self):
             """Browse for input file"""
@@ -378,12 +687,27 @@ def gui_mode():
                 self.output_file.set(filename)
 
         def log(self, message):
-            """Log message to status text"""
+            """Log message to status text (written in batches)"""
+            self._log_buf.append(message)
+            if self._log_flush_id is None:
+                self._log_flush_id = self.master.after(50, self._flush_log)
+
+        def _flush_log(self):
+            """Write all buffered log messages with a single insert"""
+            if self._log_flush_id is not None:
+                self.master.after_cancel(self._log_flush_id)
+                self._log_flush_id = None
+
+            if not self._log_buf:
+                return
+
+            text = "\n".join(self._log_buf) + "\n"
+            self._log_buf = []
+
             self.status_text.config(state='normal')
-            self.status_text.insert(tk.END, message + "\n")
+            self.status_text.insert(tk.END, text)
             self.status_text.see(tk.END)
             self.status_text.config(state='disabled')
-            self.master.update()
 
         def process_file(self):
             """Process the selected file"""
@@ -409,75 +733,89 @@ def gui_mode():
             self.status_text.delete(1.0, tk.END)
             self.status_text.config(state='disabled')
 
-            try:
-                self.log(f"Processing file: {input_file}")
-                self.log(f"Analysis enabled: {self.do_analysis.get()}")
-                self.log("Please wait, this may take a few minutes...")
-                self.log("")
+            # Run on a worker thread so the window stays responsive;
+            # _drain_log picks up its messages and the result. It is a
+            # daemon thread so closing the window does not wait for it.
+            self._process_error = None
+            self._process_thread = threading.Thread(
+                target=self._do_process,
+                args=(input_file, output_file, self.do_analysis.get()),
+                daemon=True)
+            self._process_thread.start()
 
-                # Suppress stdout during processing
-                import io
-                import sys
-                from contextlib import redirect_stdout, redirect_stderr
+        def _do_process(self, input_file, output_file, do_analysis):
+            """Process and save a file (runs on the worker thread)"""
+            log = self._log_queue.put
 
-                old_stdout = sys.stdout
-                old_stderr = sys.stderr
+            try:
+                log(f"Processing file: {input_file}")
+                log(f"Analysis enabled: {do_analysis}")
+                log("Please wait, this may take a few minutes...")
+                log("")
 
-                try:
-                    sys.stdout = io.StringIO()
-                    sys.stderr = io.StringIO()
+                # Suppress stdout during processing
+                with _suppress_output():
                     processed_data = process_and_store(
                         input_file,
-                        do_analysis=self.do_analysis.get()
+                        do_analysis=do_analysis
                     )
-                finally:
-                    sys.stdout = old_stdout
-                    sys.stderr = old_stderr
 
-                self.log(
+                log(
                     f"Processing complete! Processed {len(processed_data.active_channels)} channels.")
-                self.log("")
-                self.log(f"Saving processed data to: {output_file}")
+                log("")
+                log(f"Saving processed data to: {output_file}")
 
-                try:
-                    sys.stdout = io.StringIO()
-                    sys.stderr = io.StringIO()
+                with _suppress_output():
                     save_processed_data(processed_data, output_file)
-                finally:
-                    sys.stdout = old_stdout
-                    sys.stderr = old_stderr
 
-                self.log("Successfully saved processed data")
+                log("Successfully saved processed data")
 
-                self.log("\n" + "=" * 60)
-                self.log("Processing complete!")
-                self.log("=" * 60)
-                self.log(f"Output file: {output_file}")
-                self.log(
+                log("\n" + "=" * 60)
+                log("Processing complete!")
+                log("=" * 60)
+                log(f"Output file: {output_file}")
+                log(
                     f"Channels processed: {len(processed_data.active_channels)}")
-                self.log(
+                log(
                     f"Recording length: {processed_data.recording_length:.2f} seconds")
-                self.log(f"Sampling rate: {processed_data.sampling_rate} Hz")
-
-                messagebox.showinfo("Success", "Processing complete!")
+                log(f"Sampling rate: {processed_data.sampling_rate} Hz")
 
             except Exception as e:
-                self.log(f"\nError: {e}")
+                log(f"\nError: {e}")
                 import traceback
-                self.log(traceback.format_exc())
-                messagebox.showerror("Error", f"An error occurred:\n{e}")
+                log(traceback.format_exc())
+                self._process_error = e
 
-            finally:
+        def _drain_log(self):
+            """Show queued worker messages and finish completed processing"""
+            thread = self._process_thread
+            finished = thread is not None and not thread.is_alive()
+
+            while True:
+                try:
+                    message = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self.log(message)
+
+            if finished:
+                # Show the full log before the result dialog
+                self._flush_log()
+                self._process_thread = None
                 self.process_button.config(state='normal')
+                error = self._process_error
+                if error is None:
+                    messagebox.showinfo("Success", "Processing complete!")
+                else:
+                    messagebox.showerror(
+                        "Error", f"An error occurred:\n{error}")
+
+            self.master.after(50, self._drain_log)
 
         def create_grid(self):
-            """Create a 64x64 grid of cells"""
+            """Create a 64x64 grid of cells, or fit the existing grid to the canvas"""
             grid_size = 64
 
-            # Clear existing grid
-            self.grid_canvas.delete("all")
-            self.grid_cells.clear()
-
             # Update canvas to get current size
             self.grid_canvas.update()
             canvas_width = self.grid_canvas.winfo_width()
@@ -491,6 +829,23 @@ def gui_mode():
             x_offset = (canvas_width - grid_pixel_size) / 2
             y_offset = (canvas_height - grid_pixel_size) / 2
 
+            if self.grid_cells and self.grid_geometry:
+                # Resize the existing cells in place rather than recreating
+                # all 4096 items; this also keeps their fill colours
+                old_x_offset, old_y_offset, old_cell_size = self.grid_geometry
+                factor = cell_size / old_cell_size
+                self.grid_canvas.scale(
+                    'cell', old_x_offset, old_y_offset, factor, factor)
+                self.grid_canvas.move(
+                    'cell', x_offset - old_x_offset, y_offset - old_y_offset)
+                self.grid_geometry = (x_offset, y_offset, cell_size)
+                return
+
+            # Clear existing grid
+            self.grid_canvas.delete("all")
+            self.grid_cells.clear()
+            self.cell_channels.clear()
+
             # Create 64x64 grid (centered in canvas)
             for row in range(grid_size):
                 for col in range(grid_size):
@@ -505,23 +860,35 @@ def gui_mode():
                         fill='white',
                         outline='darkgray',
                         width=0.5,
-                        tags=('cell', f'r{row}c{col}')
+                        tags=('cell',)
                     )
 
                     self.grid_cells[(row, col)] = cell_id
+                    self.cell_channels[cell_id] = (row, col)
+
+            self.grid_geometry = (x_offset, y_offset, cell_size)
 
             # Bind events
             self.grid_canvas.bind('<Button-1>', self.on_grid_click)
             self.grid_canvas.bind('<Motion>', self.on_grid_hover)
             self.grid_canvas.bind('<Leave>', self.hide_tooltip)
             self.grid_canvas.bind(
-                '<Configure>', lambda e: self.create_grid())  # Redraw on resize
+                '<Configure>', self.schedule_grid_redraw)  # Redraw on resize
+
+        def schedule_grid_redraw(self, event=None):
+            """Redraw the grid once a burst of resize events has settled"""
+            if self._grid_redraw_id is not None:
+                self.master.after_cancel(self._grid_redraw_id)
+            self._grid_redraw_id = self.master.after(80, self._redraw_grid)
+
+        def _redraw_grid(self):
+            self._grid_redraw_id = None
+            self.create_grid()
 
         def update_grid_for_channels(self):
             """Update grid to show only active channels"""
-            # Reset all cells to white (active)
-            for (row, col), cell_id in self.grid_cells.items():
-                self.grid_canvas.itemconfig(cell_id, fill='white')
+            # Reset all cells to white in a single Tcl call via the shared tag
+            self.grid_canvas.itemconfig('cell', fill='white')
 
             # Highlight active channels in black
             for row, col in self.all_channels:
@@ -529,88 +896,76 @@ def gui_mode():
                     cell_id = self.grid_cells[(row, col)]
                     self.grid_canvas.itemconfig(cell_id, fill='black')
 
-        def on_grid_click(self, event):
-            """Handle grid cell click"""
+        def cell_at(self, event):
+            """Return the (row, col) grid cell under the mouse, or None"""
             canvas = event.widget
             x = canvas.canvasx(event.x)
             y = canvas.canvasy(event.y)
 
             items = canvas.find_overlapping(x, y, x, y)
             if items:
-                tags = canvas.gettags(items[0])
-                for tag in tags:
-                    if tag.startswith('r') and 'c' in tag:
-                        # Parse row and col from tag
-                        parts = tag[1:].split('c')
-                        if len(parts) == 2:
-                            row = int(parts[0])
-                            col = int(parts[1])
-
-                            # Check if this is an active channel
-                            if (row, col) in self.all_channels:
-                                # Deselect previous
-                                if self.selected_cell_id:
-                                    self.grid_canvas.itemconfig(
-                                        self.selected_cell_id, fill='white')
-
-                                # Select new
-                                self.selected_channel = (row, col)
-                                self.selected_cell_id = self.grid_cells[(
-                                    row, col)]
-                                self.grid_canvas.itemconfig(
-                                    self.selected_cell_id, fill='green')
-
-                                # Auto-plot
-                                self.plot_signal()
-                        break
+                return self.cell_channels.get(items[0])
+            return None
+
+        def on_grid_click(self, event):
+            """Handle grid cell click"""
+            cell = self.cell_at(event)
+            if cell is None:
+                return
+
+            row, col = cell
+
+            # Check if this is an active channel
+            if (row, col) in self.active_channel_set:
+                # Deselect previous
+                if self.selected_cell_id:
+                    self.grid_canvas.itemconfig(
+                        self.selected_cell_id, fill='white')
+
+                # Select new
+                self.selected_channel = (row, col)
+                self.selected_cell_id = self.grid_cells[(row, col)]
+                self.grid_canvas.itemconfig(
+                    self.selected_cell_id, fill='green')
+
+                # Auto-plot
+                self.plot_signal()
 
         def on_grid_hover(self, event):
             """Show tooltip and highlight on hover"""
-            canvas = event.widget
-            x = canvas.canvasx(event.x)
-            y = canvas.canvasy(event.y)
-
-            items = canvas.find_overlapping(x, y, x, y)
-            if items:
-                tags = canvas.gettags(items[0])
-                for tag in tags:
-                    if tag.startswith('r') and 'c' in tag:
-                        # Parse row and col from tag
-                        parts = tag[1:].split('c')
-                        if len(parts) == 2:
-                            row = int(parts[0])
-                            col = int(parts[1])
-
-                            # Update hover highlight
-                            if (row, col) != self.hovered_channel:
-                                # Unhighlight previous hover
-                                if self.hovered_cell_id and self.hovered_channel != self.selected_channel:
-                                    prev_row, prev_col = self.hovered_channel
-                                    if self.hovered_channel in self.all_channels:
-                                        self.grid_canvas.itemconfig(
-                                            self.hovered_cell_id, fill='black')
-                                    else:
-                                        self.grid_canvas.itemconfig(
-                                            self.hovered_cell_id, fill='white')
-
-                                # Highlight current hover (only if not selected)
-                                if (row, col) != self.selected_channel:
-                                    cell_id = self.grid_cells[(row, col)]
-                                    if (row, col) in self.all_channels:
-                                        self.grid_canvas.itemconfig(
-                                            cell_id, fill='lightblue')
-                                    else:
-                                        self.grid_canvas.itemconfig(
-                                            cell_id, fill='gray')
-                                    self.hovered_cell_id = cell_id
-                                    self.hovered_channel = (row, col)
-
-                            # Show tooltip
-                            self.show_tooltip(event, row, col)
-                        break
-            else:
+            cell = self.cell_at(event)
+            if cell is None:
                 self.clear_hover()
                 self.hide_tooltip()
+                return
+
+            row, col = cell
+
+            # Update hover highlight
+            if (row, col) != self.hovered_channel:
+                # Unhighlight previous hover
+                if self.hovered_cell_id and self.hovered_channel != self.selected_channel:
+                    if self.hovered_channel in self.active_channel_set:
+                        self.grid_canvas.itemconfig(
+                            self.hovered_cell_id, fill='black')
+                    else:
+                        self.grid_canvas.itemconfig(
+                            self.hovered_cell_id, fill='white')
+
+                # Highlight current hover (only if not selected)
+                if (row, col) != self.selected_channel:
+                    cell_id = self.grid_cells[(row, col)]
+                    if (row, col) in self.active_channel_set:
+                        self.grid_canvas.itemconfig(
+                            cell_id, fill='lightblue')
+                    else:
+                        self.grid_canvas.itemconfig(
+                            cell_id, fill='gray')
+                    self.hovered_cell_id = cell_id
+                    self.hovered_channel = (row, col)
+
+            # Show tooltip
+            self.show_tooltip(event, row, col)
 
         def show_tooltip(self, event, row, col):
             """Display tooltip with channel coordinates"""
@@ -631,7 +986,7 @@ def gui_mode():
         def clear_hover(self):
             """Clear hover highlight"""
             if self.hovered_cell_id and self.hovered_channel != self.selected_channel:
-                if self.hovered_channel in self.all_channels:
+                if self.hovered_channel in self.active_channel_set:
                     self.grid_canvas.itemconfig(
                         self.hovered_cell_id, fill='black')
                 else:
@@ -667,22 +1022,25 @@ def gui_mode():
 
             try:
                 # Suppress stdout during loading
-                import io
-                import sys
-
-                old_stdout = sys.stdout
-                old_stderr = sys.stderr
-
-                try:
-                    sys.stdout = io.StringIO()
-                    sys.stderr = io.StringIO()
-                    self.viewer_data = load_processed_data(filename)
-                finally:
-                    sys.stdout = old_stdout
-                    sys.stderr = old_stderr
+                with _suppress_output():
+                    viewer_data = load_processed_data(filename)
+
+                # All channels share one time axis; build it once here so
+                # plotting only takes a view of it
+                channels = (get_channel_data(viewer_data, row, col)
+                            for row, col in viewer_data.active_channels)
+                num_samples = max((len(channel['signal'])
+                                   for channel in channels if channel is not None),
+                                  default=0)
+                time_axis = np.arange(num_samples) / viewer_data.sampling_rate
+
+                # Only replace the current data once the new file is ready
+                self.viewer_data = viewer_data
+                self.time_axis = time_axis
 
                 # Populate channel list
                 self.all_channels = sorted(self.viewer_data.active_channels)
+                self.active_channel_set = frozenset(self.all_channels)
                 self.update_grid_for_channels()
 
                 # Select first channel by default
@@ -702,6 +1060,19 @@ def gui_mode():
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file:\n{e}")
 
+        def add_event_spans(self, event_times, color, label):
+            """Shade event intervals as a single collection (like axvspan)"""
+            from matplotlib.collections import PolyCollection
+
+            # x in data coordinates, y spanning the full axes height
+            verts = [[(event[0], 0), (event[0], 1), (event[1], 1), (event[1], 0)]
+                     for event in event_times]
+            spans = PolyCollection(verts, facecolors=color, edgecolors=color,
+                                   alpha=0.3, label=label,
+                                   transform=self.ax.get_xaxis_transform())
+            self.ax.add_collection(spans, autolim=False)
+            return spans
+
         def plot_signal(self):
             """Plot the selected channel signal"""
             if not self.matplotlib_available:
@@ -728,38 +1099,52 @@ def gui_mode():
                                          f"Active channels: {len(self.viewer_data.active_channels)}")
                     return
 
-                # Clear previous plot
-                self.ax.clear()
-
                 # Plot signal
                 signal = channel_data['signal']
-                time = self.viewer_data.time_vector[:len(signal)]
+                time = self.time_axis[:len(signal)]
+
+                # Matplotlib draws every point, so reduce long recordings to
+                # a min/max envelope a few times wider than the canvas
+                target = max(
+                    4000, self.canvas.get_tk_widget().winfo_width() * 2)
+                plot_time, plot_values = downsample_minmax(
+                    time, signal, 2 * target)
+
+                # Reuse the line artist instead of clearing and rebuilding
+                # the axes on every channel change
+                if self.signal_line is None:
+                    self.signal_line, = self.ax.plot(
+                        plot_time, plot_values, 'b-', linewidth=0.5, label='Signal')
+                else:
+                    self.signal_line.set_data(plot_time, plot_values)
+                self.ax.relim()
+                self.ax.autoscale_view()
 
-                self.ax.plot(time, signal, 'b-', linewidth=0.5, label='Signal')
+                # Remove the previous channel's event shading
+                for spans in self.event_spans:
+                    spans.remove()
+                self.event_spans = []
 
                 # Plot seizure times if available
                 if len(channel_data['SzTimes']) > 0:
-                    for sz in channel_data['SzTimes']:
-                        self.ax.axvspan(sz[0], sz[1], alpha=0.3, color='blue',
-                                        label='Seizure' if sz[0] == channel_data['SzTimes'][0][0] else '')
+                    self.event_spans.append(self.add_event_spans(
+                        channel_data['SzTimes'], 'blue', 'Seizure'))
 
                 # Plot SE times if available
                 if len(channel_data['SETimes']) > 0:
-                    for se in channel_data['SETimes']:
-                        self.ax.axvspan(se[0], se[1], alpha=0.3, color='orange',
-                                        label='SE' if se[0] == channel_data['SETimes'][0][0] else '')
+                    self.event_spans.append(self.add_event_spans(
+                        channel_data['SETimes'], 'orange', 'SE'))
 
-                self.ax.set_xlabel('Time (s)')
-                self.ax.set_ylabel('Voltage (V)')
                 self.ax.set_title(
                     f'Channel ({row}, {col}) - {len(signal)} samples @ {self.viewer_data.sampling_rate} Hz')
-                self.ax.grid(True, alpha=0.3)
 
                 # Add legend if there are events
                 if len(channel_data['SzTimes']) > 0 or len(channel_data['SETimes']) > 0 or len(channel_data['DischargeTimes']) > 0:
                     self.ax.legend(loc='upper right')
+                elif self.ax.get_legend() is not None:
+                    self.ax.get_legend().remove()
 
-                self.canvas.draw()
+                self.canvas.draw_idle()
 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to plot signal:\n{e}")
@@ -783,6 +1168,12 @@ def gui_mode():
 
 def main():
     """Main entry point"""
+    # No arguments: launch the GUI without building the argument parser
+    if len(sys.argv) == 1:
+        return gui_mode()
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="YSA Signal - Process and analyze .brw/.h5 signal files",
         formatter_class=argparse.RawDescriptionHelpFormatter,